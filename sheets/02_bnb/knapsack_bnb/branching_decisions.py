@@ -1,12 +1,38 @@
+import operator
+
+import numpy as np
+
+from .instance import Instance
+
+# Marks an item whose usage has not been decided yet.
+UNFIXED = -1
+
+
+def _unpack_bits(mask: int, length: int) -> np.ndarray:
+    """
+    Returns the lowest `length` bits of `mask` as a uint8 array of 0s and 1s.
+    """
+    packed = np.frombuffer(mask.to_bytes((length + 7) // 8, "little"), dtype=np.uint8)
+    return np.unpackbits(packed, count=length, bitorder="little")
+
+
 class BranchingDecisions:
     """
     Represents the binary branching decisions made during the branch-and-bound algorithm.
 
     This class provides methods to initialize, access, fix, and split the branching decisions.
 
+    The decisions are stored as two bitmasks: bit i of `fixed_mask` tells whether
+    item i is fixed, and bit i of `value_mask` tells whether it is fixed to 1.
+    Copying the decisions for a child node thus only copies two integers.
+
     Args:
         length (int): Number of variables.
 
+    Attributes:
+        fixed_mask (int): Bitmask of the fixed items.
+        value_mask (int): Bitmask of the items fixed to 1.
+
     Methods:
         __getitem__(index) -> int
             Get the decision at `index`.
@@ -18,13 +44,54 @@ class BranchingDecisions:
             Iterate over the branching decisions.
         split_on(index) -> (BranchingDecisions, BranchingDecisions)
             Split the branching decisions into two based on the specified index.
+        to_numpy() -> np.ndarray
+            Get the decisions as an int8 array with UNFIXED (-1) for undecided items.
+        first_unfixed() -> int
+            Get the index of the first undecided item, or -1 if all are fixed.
+        fixed_weight(instance) -> int
+            Get the total weight of the items fixed to 1.
     """
 
+    __slots__ = (
+        "_length",
+        "_instance",
+        "_array",
+        "fixed_mask",
+        "value_mask",
+        "_fixed_weight",
+    )
+
     def __init__(self, length: int) -> None:
-        self._assignments: list[int | None] = [None] * length
+        self._length = length
+        # Lazily computed result of `to_numpy`, reset whenever an item is fixed.
+        self._array: np.ndarray | None = None
+        self.fixed_mask = 0
+        self.value_mask = 0
+        # The instance the fixed weight below refers to, set on the first call
+        # of `fixed_weight`. From then on, the weight is updated incrementally
+        # in `fix` and passed on by `copy`, as a child only fixes one more item
+        # than its parent.
+        self._instance: Instance | None = None
+        self._fixed_weight = 0
+
+    def _normalize_index(self, item_index: int) -> int:
+        """
+        Maps a possibly negative index to its bit position, like `list` does.
+        NumPy integers are converted to `int`, as shifting by them would turn
+        the masks into fixed-width NumPy integers.
+        """
+        item_index = operator.index(item_index)
+        if item_index < 0:
+            item_index += self._length
+        if not 0 <= item_index < self._length:
+            raise IndexError("Item index out of range.")
+        return item_index
 
     def __getitem__(self, item_index: int) -> int | None:
-        return self._assignments[item_index]
+        item_index = self._normalize_index(item_index)
+        if not (self.fixed_mask >> item_index) & 1:
+            return None
+        return (self.value_mask >> item_index) & 1
 
     def fix(self, item_index: int, value: int) -> None:
         """
@@ -32,8 +99,14 @@ class BranchingDecisions:
         Only do this if you are sure that you do not prohibit the optimal solution.
         """
         assert value in {0, 1}, "Value must be 0 or 1."
-        assert self._assignments[item_index] is None, "Item is already fixed."
-        self._assignments[item_index] = value
+        item_index = self._normalize_index(item_index)
+        assert self[item_index] is None, "Item is already fixed."
+        self.fixed_mask |= 1 << item_index
+        self._array = None
+        if value == 1:
+            self.value_mask |= 1 << item_index
+            if self._instance is not None:
+                self._fixed_weight += int(self._instance.weights[item_index])
 
     def copy(self) -> "BranchingDecisions":
         """Create a copy of the branching decisions.
@@ -45,27 +118,79 @@ class BranchingDecisions:
             >>> decisions = BranchingDecisions(5)
             >>> copy = decisions.copy()
         """
-        copy = BranchingDecisions(len(self))
-        copy._assignments = self._assignments.copy()
+        copy = BranchingDecisions(self._length)
+        # the cached array is read-only, so it can be shared until a fix
+        copy._array = self._array
+        copy.fixed_mask = self.fixed_mask
+        copy.value_mask = self.value_mask
+        copy._instance = self._instance
+        copy._fixed_weight = self._fixed_weight
         return copy
 
     def included_items(self) -> list[int]:
         """
         Returns a list of fixed included items
         """
-        return [idx for idx, assigned in enumerate(self._assignments) if assigned == 1]
+        return np.flatnonzero(self.to_numpy() == 1).tolist()
 
     def excluded_items(self) -> list[int]:
         """
         Returns a list of fixed excluded items
         """
-        return [idx for idx, assigned in enumerate(self._assignments) if assigned == 0]
+        return np.flatnonzero(self.to_numpy() == 0).tolist()
 
     def __len__(self) -> int:
-        return len(self._assignments)
+        return self._length
 
     def __iter__(self):
-        return iter(self._assignments)
+        return (None if x == UNFIXED else x for x in self.to_numpy().tolist())
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Returns the decisions as a read-only int8 array, with 0 and 1 for
+        fixed items and UNFIXED (-1) for items that are not decided yet.
+        """
+        if self._array is None:
+            fixed = _unpack_bits(self.fixed_mask, self._length)
+            values = _unpack_bits(self.value_mask, self._length)
+            array = np.where(fixed, values, UNFIXED).astype(np.int8)
+            array.setflags(write=False)
+            self._array = array
+        return self._array
+
+    def first_unfixed(self) -> int:
+        """Get the index of the first item that is not fixed yet.
+
+        Returns:
+            int: The smallest index of an unfixed item, or -1 if all items are fixed.
+
+        Examples:
+            >>> decisions = BranchingDecisions(5)
+            >>> decisions.fix(0, 1)
+            >>> decisions.first_unfixed()
+            1
+        """
+        unfixed_mask = ~self.fixed_mask & ((1 << self._length) - 1)
+        # isolate the lowest set bit instead of scanning the items
+        return (unfixed_mask & -unfixed_mask).bit_length() - 1
+
+    def fixed_weight(self, instance: Instance) -> int:
+        """Get the total weight of the items fixed to 1.
+
+        The first call computes the sum; afterwards, it is updated with every
+        fixed item and inherited by copies and splits.
+
+        Args:
+            instance: The instance the decisions belong to.
+
+        Returns:
+            int: The total weight of the items fixed to 1.
+        """
+        if instance is not self._instance:
+            included = self.to_numpy() == 1
+            self._instance = instance
+            self._fixed_weight = int(instance.weights[included].sum())
+        return self._fixed_weight
 
     def is_fixed(self) -> bool:
         """Check if all items are fixed.
@@ -79,7 +204,7 @@ class BranchingDecisions:
             >>> decisions.is_fixed()
             False
         """
-        return all(x is not None for x in self._assignments)
+        return self.fixed_mask == (1 << self._length) - 1
 
     def split_on(
         self, item_index: int
@@ -101,10 +226,8 @@ class BranchingDecisions:
             >>> left, right = decisions.split_on(2)
         """
 
-        left = BranchingDecisions(len(self))
-        right = BranchingDecisions(len(self))
-        left._assignments = self._assignments.copy()
-        right._assignments = self._assignments.copy()
+        left = self.copy()
+        right = self.copy()
         left.fix(item_index, 0)
         right.fix(item_index, 1)
         return left, right
@@ -39,14 +39,12 @@ class FirstUndecidedBranchingStrategy(BranchingStrategy):
     """
 
     def make_branching_decisions(self, node: BnBNode) -> Tuple[BranchingDecisions, ...]:
+        decisions = node.branching_decisions
         # find the smallest index i where no decision has been made
-        first_unfixed = min(
-            (i for i, val in enumerate(node.branching_decisions) if val is None),
-            default=-1,
-        )
+        first_unfixed = decisions.first_unfixed()
         if first_unfixed < 0:
             return ()  # leaf node, nothing to branch
-        return node.branching_decisions.split_on(first_unfixed)
+        return decisions.split_on(first_unfixed)
 
 
 class MyBranchingStrategy(BranchingStrategy):
@@ -60,10 +58,7 @@ class MyBranchingStrategy(BranchingStrategy):
 
     def make_branching_decisions(self, node: BnBNode) -> Tuple[BranchingDecisions, ...]:
         # placeholder: branch on the first unfixed variable
-        first_unfixed = min(
-            (i for i, val in enumerate(node.branching_decisions) if val is None),
-            default=-1,
-        )
+        first_unfixed = node.branching_decisions.first_unfixed()
         if first_unfixed < 0:
             return ()
         return node.branching_decisions.split_on(first_unfixed)
@@ -24,13 +24,15 @@ class HeuristicSolution(RelaxedSolution):
     Inherits from `RelaxedSolution` for compatibility with the rest of the codebase.
     """
 
+    __slots__ = ()
+
     def copy(self) -> "HeuristicSolution":
         """
         Return a deep copy of this heuristic solution.
         """
         return HeuristicSolution(
             self.instance,
-            list(self.selection),
+            self.selection.copy(),
             self.upper_bound,
         )
 
@@ -1,3 +1,6 @@
+from functools import cached_property
+
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -13,6 +16,36 @@ class Item(BaseModel):
     model_config = ConfigDict(frozen=True)
 
 
+def _int_array(numbers: list[int]) -> np.ndarray:
+    """
+    Returns the non-negative integers as an int64 array, or as an array of
+    Python ints if their total does not fit into 64 bits. Item values and
+    weights are unbounded, and this keeps every sum over them exact.
+    """
+    if sum(numbers) <= np.iinfo(np.int64).max:
+        return np.array(numbers, dtype=np.int64)
+    return np.array(numbers, dtype=object)
+
+
+class _ItemArrays:
+    """
+    The item data as NumPy arrays (structure of arrays), such that relaxations
+    and heuristics can work on all items at once instead of looping over them.
+
+    The arrays are read-only, as the instance itself is immutable. The class
+    intentionally does not define `__eq__`, such that comparing two instances
+    falls back to comparing their fields.
+    """
+
+    __slots__ = ("values", "weights")
+
+    def __init__(self, items: list[Item]) -> None:
+        self.values = _int_array([item.value for item in items])
+        self.weights = _int_array([item.weight for item in items])
+        for array in (self.values, self.weights):
+            array.setflags(write=False)
+
+
 class Instance(BaseModel):
     """
     Represents an instance with a list of items and capacity of the knapsack problem.
@@ -29,3 +62,21 @@ class Instance(BaseModel):
 
     # Prevent the model from being modified after creation
     model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def _item_arrays(self) -> _ItemArrays:
+        return _ItemArrays(self.items)
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        The values of the items as a read-only NumPy array.
+        """
+        return self._item_arrays.values
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        The weights of the items as a read-only NumPy array.
+        """
+        return self._item_arrays.weights
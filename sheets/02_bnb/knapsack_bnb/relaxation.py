@@ -24,6 +24,8 @@ so that:
 
 import abc
 
+import numpy as np
+
 from .branching_decisions import BranchingDecisions
 from .instance import Instance
 from .relaxed_solution import RelaxedSolution
@@ -68,9 +70,9 @@ class VeryNaiveRelaxationSolver(RelaxationSolver):
         self, instance: Instance, decisions: BranchingDecisions
     ) -> RelaxedSolution:
         # build selection: 1.0 for fixed 1 or unfixed, 0 for fixed 0
-        selection = [0.0 if x == 0 else 1.0 for x in decisions]
+        selection = (decisions.to_numpy() != 0).astype(np.float64)
         # compute objective value
-        upper = sum(item.value * sel for item, sel in zip(instance.items, selection))
+        upper = float(instance.values @ selection)
         return RelaxedSolution(instance, selection, upper)
 
 
@@ -82,13 +84,12 @@ class NaiveRelaxationSolver(RelaxationSolver):
     def solve(
         self, instance: Instance, decisions: BranchingDecisions
     ) -> RelaxedSolution:
-        # compute capacity after fixed 1 items
-        used = sum(item.weight for item, x in zip(instance.items, decisions) if x == 1)
-        if used > instance.capacity:
+        # capacity used by the fixed 1 items, tracked by the decisions
+        if decisions.fixed_weight(instance) > instance.capacity:
             return RelaxedSolution.create_infeasible(instance)
 
-        selection = [0.0 if x == 0 else 1.0 for x in decisions]
-        upper = sum(item.value * sel for item, sel in zip(instance.items, selection))
+        selection = (decisions.to_numpy() != 0).astype(np.float64)
+        upper = float(instance.values @ selection)
         return RelaxedSolution(instance, selection, upper)
 
 
@@ -103,11 +104,10 @@ class MyRelaxationSolver(RelaxationSolver):
         self, instance: Instance, decisions: BranchingDecisions
     ) -> RelaxedSolution:
         # placeholder: behave like NaiveRelaxationSolver
-        used = sum(item.weight for item, x in zip(instance.items, decisions) if x == 1)
-        if used > instance.capacity:
+        if decisions.fixed_weight(instance) > instance.capacity:
             return RelaxedSolution.create_infeasible(instance)
-        selection = [0.0 if x == 0 else 1.0 for x in decisions]
-        upper = sum(item.value * sel for item, sel in zip(instance.items, selection))
+        selection = (decisions.to_numpy() != 0).astype(np.float64)
+        upper = float(instance.values @ selection)
         return RelaxedSolution(instance, selection, upper)
 
 
@@ -13,6 +13,8 @@ You should ensure your relaxation solver produces RelaxedSolution objects that:
 
 from typing import Sequence
 
+import numpy as np
+
 from .instance import Instance
 
 
@@ -24,10 +26,15 @@ class RelaxedSolution:
         instance: the knapsack Instance (with `items` and `capacity`).
         selection: a sequence of floats in [0,1], one per item;
                    fixed items must match your fixation (0 or 1).
+                   It is copied into a float64 NumPy array.
         upper_bound: an upper bound on the value of any 0/1 solution
                      consistent with `selection` fixations.
     """
 
+    # The search keeps a relaxed solution per open node, so avoid a __dict__
+    # per object.
+    __slots__ = ("instance", "selection", "upper_bound")
+
     def __init__(
         self,
         instance: Instance,
@@ -37,7 +44,7 @@ class RelaxedSolution:
         if len(selection) != len(instance.items):
             raise ValueError("`selection` length must match number of items.")
         self.instance = instance
-        self.selection = list(selection)
+        self.selection = np.array(selection, dtype=np.float64)
         self.upper_bound = upper_bound
 
         # Validate consistency: bound must exceed or equal actual value.
@@ -55,7 +62,7 @@ class RelaxedSolution:
         """
         return RelaxedSolution(
             instance,
-            [0.0] * len(instance.items),
+            np.zeros(len(instance.items)),
             upper_bound=float("-inf"),
         )
 
@@ -69,18 +76,13 @@ class RelaxedSolution:
         """
         Compute total value = sum(item.value * fraction).
         """
-        return sum(
-            item.value * frac for item, frac in zip(self.instance.items, self.selection)
-        )
+        return float(self.instance.values @ self.selection)
 
     def weight(self) -> float:
         """
         Compute total weight = sum(item.weight * fraction).
         """
-        return sum(
-            item.weight * frac
-            for item, frac in zip(self.instance.items, self.selection)
-        )
+        return float(self.instance.weights @ self.selection)
 
     def does_obey_capacity_constraint(self) -> bool:
         """
@@ -89,8 +91,8 @@ class RelaxedSolution:
         """
         if self.is_infeasible():
             return False
-        return (
-            all(0.0 <= frac <= 1.0 for frac in self.selection)
+        return bool(
+            ((self.selection >= 0.0) & (self.selection <= 1.0)).all()
             and self.weight() <= self.instance.capacity
         )
 
@@ -100,7 +102,7 @@ class RelaxedSolution:
         """
         if self.is_infeasible():
             return False
-        return all(frac == int(frac) for frac in self.selection)
+        return bool(np.array_equal(self.selection, np.floor(self.selection)))
 
     def __str__(self) -> str:
         """
@@ -108,7 +110,7 @@ class RelaxedSolution:
         Fractions are shown with one decimal if non-integer.
         """
         parts = []
-        for frac in self.selection:
+        for frac in self.selection.tolist():
             if frac == int(frac):
                 parts.append(str(int(frac)))
             else: